@@ -2,6 +2,22 @@
 FCFS Scheduler - Implements First Come First Served scheduling algorithm
 """
 
+import bisect
+import heapq
+import sys
+from operator import attrgetter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from task import Task
+from virtual_machine import VirtualMachine
+
+
+# Below this many VMs a sorted list beats a heap for picking the next VM
+SORTED_VM_LIMIT = 8
+
+
 class FCFSScheduler:
     """
     Implements FCFS (First Come First Served) scheduling algorithm.
@@ -9,7 +25,7 @@ class FCFSScheduler:
     This scheduler assigns tasks to VMs based on arrival order and VM availability.
     """
     
-    def __init__(self, tasks, vms):
+    def __init__(self, tasks: List[Task], vms: List[VirtualMachine]) -> None:
         """
         Initialize the scheduler.
         
@@ -21,23 +37,39 @@ class FCFSScheduler:
         self.vms = vms
         self.makespan = 0
         
-    def sort_tasks_by_arrival(self):
+        # Built from the live VM times at the start of each simulate_execution
+        self._vm_heap: List[Tuple[int, int, VirtualMachine]] = []
+        
+    def _build_vm_heap(self) -> None:
+        """
+        Build the min-heap of (available_time, position, vm) entries used to
+        pick the next VM. The position keeps ties resolved in the original
+        VM order. For fewer than SORTED_VM_LIMIT VMs the entries are kept
+        fully sorted instead (a sorted list is also a valid heap).
+        """
+        self._vm_heap = [(vm.available_time, i, vm) for i, vm in enumerate(self.vms)]
+        if len(self.vms) < SORTED_VM_LIMIT:
+            self._vm_heap.sort()
+        else:
+            heapq.heapify(self._vm_heap)
+        
+    def sort_tasks_by_arrival(self) -> None:
         """
         Sort tasks by arrival time (FCFS principle).
         Tasks with the same arrival time maintain their original order.
         """
-        self.tasks.sort(key=lambda task: (task.arrival_time, task.task_id))
+        self.tasks.sort(key=attrgetter('arrival_time', 'task_id'))
         
-    def find_earliest_available_vm(self):
+    def find_earliest_available_vm(self) -> VirtualMachine:
         """
         Find the VM that will be available first.
         
         Returns:
             VirtualMachine: The VM with the earliest available time
         """
-        return min(self.vms, key=lambda vm: vm.available_time)
+        return min(self.vms, key=attrgetter('available_time'))
     
-    def simulate_execution(self):
+    def simulate_execution(self, verbose: bool = True) -> None:
         """
         Simulate the execution of all tasks using FCFS algorithm.
         
@@ -45,36 +77,67 @@ class FCFSScheduler:
         1. Sort tasks by arrival time
         2. For each task, assign to earliest available VM
         3. Update VM and task scheduling information
+        
+        Args:
+            verbose (bool): Print the task execution order (skipped entirely
+                when False, e.g. for large benchmark runs)
         """
         # Step 1: Sort tasks by arrival time (FCFS)
         self.sort_tasks_by_arrival()
         
-        print("=" * 70)
-        print("FCFS SCHEDULING SIMULATION - Cloud Video Rendering System")
-        print("=" * 70)
-        print(f"\nTotal Tasks: {len(self.tasks)}")
-        print(f"Total VMs: {len(self.vms)}")
-        print("\nTask Execution Order (FCFS):")
-        print("-" * 70)
-        
-        # Step 2: Assign each task to the earliest available VM
+        # Order the VMs by their current available time; they may have
+        # changed (or been used by another scheduler) since construction
+        self._build_vm_heap()
+        
+        # Seed the makespan with work the VMs already had before this run
+        makespan = max((vm.available_time for vm in self.vms), default=0)
+        
+        # Step 2: Assign each task to the earliest available VM, tracking the
+        # makespan (time when last task completes) as we go. The VMs are
+        # identical, so the front of the VM heap is always the right choice;
+        # a fixed round-robin order is not, once burst times differ.
+        if len(self.vms) < SORTED_VM_LIMIT:
+            # Few VMs: take the front of the sorted list, re-insert with bisect
+            vm_queue = self._vm_heap
+            for task in self.tasks:
+                _, position, vm = vm_queue.pop(0)
+                _, completion_time = vm.assign_task(task)
+                bisect.insort(vm_queue, (vm.available_time, position, vm))
+                if completion_time > makespan:
+                    makespan = completion_time
+        else:
+            for task in self.tasks:
+                _, position, vm = heapq.heappop(self._vm_heap)
+                _, completion_time = vm.assign_task(task)
+                heapq.heappush(self._vm_heap, (vm.available_time, position, vm))
+                if completion_time > makespan:
+                    makespan = completion_time
+        self.makespan = makespan
+        
+        if not verbose:
+            return
+        
+        # Step 3: Report the execution order in a single write to stdout
+        rows = [
+            "=" * 70,
+            "FCFS SCHEDULING SIMULATION - Cloud Video Rendering System",
+            "=" * 70,
+            f"\nTotal Tasks: {len(self.tasks)}",
+            f"Total VMs: {len(self.vms)}",
+            "\nTask Execution Order (FCFS):",
+            "-" * 70,
+        ]
         for task in self.tasks:
-            vm = self.find_earliest_available_vm()
-            start_time, completion_time = vm.assign_task(task)
-            
-            print(f"Task {task.task_id}: "
-                  f"Arrival={task.arrival_time}, "
-                  f"Burst={task.burst_time}, "
-                  f"Start={start_time}, "
-                  f"End={completion_time}, "
-                  f"VM={vm.vm_id}")
-        
-        # Step 3: Calculate makespan (time when last task completes)
-        self.makespan = max(vm.available_time for vm in self.vms)
-        
-        print("-" * 70)
-        
-    def calculate_metrics(self):
+            rows.append(f"Task {task.task_id}: "
+                        f"Arrival={task.arrival_time}, "
+                        f"Burst={task.burst_time}, "
+                        f"Start={task.start_time}, "
+                        f"End={task.completion_time}, "
+                        f"VM={task.vm_id}")
+        rows.append("-" * 70)
+        sys.stdout.write("\n".join(rows) + "\n")
+        
+    def calculate_metrics(self) -> Dict[str, float]:
         """
         Calculate and display performance metrics.
         
@@ -91,23 +154,33 @@ class FCFSScheduler:
         # Makespan
         print(f"\n1. Makespan (Total Completion Time): {self.makespan} time units")
         
-        # VM Utilization
+        # VM Utilization, computed once for the per-VM lines and the average
+        busy = np.fromiter((vm.total_busy_time for vm in self.vms),
+                           dtype=np.int64, count=len(self.vms))
+        if self.makespan:
+            utilizations = busy / self.makespan * 100
+        else:
+            utilizations = np.zeros(len(self.vms))
+        
         print(f"\n2. Virtual Machine Utilization:")
-        for vm in self.vms:
-            utilization = vm.get_utilization(self.makespan)
+        for vm, utilization in zip(self.vms, utilizations.tolist()):
             print(f"   {vm.vm_id}: {utilization:.2f}% "
                   f"(Busy: {vm.total_busy_time}/{self.makespan} time units)")
         
         # Average utilization
-        avg_utilization = sum(vm.get_utilization(self.makespan) for vm in self.vms) / len(self.vms)
+        avg_utilization = float(utilizations.mean())
         print(f"   Average VM Utilization: {avg_utilization:.2f}%")
         
         # Waiting and Turnaround times
-        total_waiting_time = sum(task.get_waiting_time() for task in self.tasks)
-        total_turnaround_time = sum(task.get_turnaround_time() for task in self.tasks)
+        count = len(self.tasks)
+        waiting = np.fromiter((task.waiting_time for task in self.tasks), dtype=np.int64, count=count)
+        turnaround = np.fromiter((task.turnaround_time for task in self.tasks), dtype=np.int64, count=count)
+        
+        total_waiting_time = int(waiting.sum())
+        total_turnaround_time = int(turnaround.sum())
         
-        avg_waiting_time = total_waiting_time / len(self.tasks)
-        avg_turnaround_time = total_turnaround_time / len(self.tasks)
+        avg_waiting_time = total_waiting_time / count
+        avg_turnaround_time = total_turnaround_time / count
         
         print(f"\n3. Average Waiting Time: {avg_waiting_time:.2f} time units")
         print(f"4. Average Turnaround Time: {avg_turnaround_time:.2f} time units")
@@ -121,7 +194,7 @@ class FCFSScheduler:
             'avg_turnaround_time': avg_turnaround_time
         }
     
-    def get_scheduling_data(self):
+    def get_scheduling_data(self) -> List[Dict[str, Any]]:
         """
         Get scheduling data for visualization.
         
@@ -0,0 +1,21 @@
+"""
+Optional Cython build for the scheduling core.
+
+The modules stay plain Python; the .pxd files next to them give Cython
+the typed attribute and method declarations. Build in place with:
+
+    python setup.py build_ext --inplace
+
+and main.py will import the compiled extensions automatically.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='fcfs_scheduler',
+    ext_modules=cythonize(
+        ['task.py', 'virtual_machine.py', 'scheduler.py'],
+        compiler_directives={'language_level': 3},
+    ),
+)
@@ -0,0 +1,11 @@
+# Cython declarations for task.py (pure Python mode); see setup.py
+
+cimport cython
+
+
+@cython.final
+cdef class Task:
+    cdef public object task_id
+    cdef public long arrival_time, burst_time
+    cdef public object start_time, completion_time, vm_id
+    cdef public long waiting_time, turnaround_time
@@ -2,6 +2,9 @@
 Task Class - Represents a video rendering job in the cloud system
 """
 
+from typing import Optional
+
+
 class Task:
     """
     Represents a single video rendering task with arrival time and burst time.
@@ -13,9 +16,24 @@ class Task:
         start_time (int): Time when task starts execution (set during scheduling)
         completion_time (int): Time when task completes (set during scheduling)
         vm_id (str): ID of VM assigned to this task (set during scheduling)
+        waiting_time (int): start_time - arrival_time (set during scheduling)
+        turnaround_time (int): completion_time - arrival_time (set during scheduling)
     """
     
-    def __init__(self, task_id, arrival_time, burst_time):
+    __slots__ = ('task_id', 'arrival_time', 'burst_time',
+                 'start_time', 'completion_time', 'vm_id',
+                 'waiting_time', 'turnaround_time')
+    
+    task_id: str
+    arrival_time: int
+    burst_time: int
+    start_time: Optional[int]
+    completion_time: Optional[int]
+    vm_id: Optional[str]
+    waiting_time: int
+    turnaround_time: int
+    
+    def __init__(self, task_id: str, arrival_time: int, burst_time: int) -> None:
         """
         Initialize a new task.
         
@@ -30,29 +48,27 @@ class Task:
         self.start_time = None
         self.completion_time = None
         self.vm_id = None
+        self.waiting_time = 0
+        self.turnaround_time = 0
         
-    def __repr__(self):
+    def __repr__(self) -> str:
         """String representation of the task."""
         return f"Task({self.task_id}, Arrival={self.arrival_time}, Burst={self.burst_time})"
     
-    def get_waiting_time(self):
+    def get_waiting_time(self) -> int:
         """
-        Calculate waiting time for this task.
+        Get waiting time for this task.
         
         Returns:
-            int: Waiting time (start_time - arrival_time)
+            int: Waiting time (start_time - arrival_time), 0 if not yet scheduled
         """
-        if self.start_time is not None:
-            return self.start_time - self.arrival_time
-        return 0
+        return self.waiting_time
     
-    def get_turnaround_time(self):
+    def get_turnaround_time(self) -> int:
         """
-        Calculate turnaround time for this task.
+        Get turnaround time for this task.
         
         Returns:
-            int: Turnaround time (completion_time - arrival_time)
+            int: Turnaround time (completion_time - arrival_time), 0 if not yet scheduled
         """
-        if self.completion_time is not None:
-            return self.completion_time - self.arrival_time
-        return 0
+        return self.turnaround_time
@@ -0,0 +1,13 @@
+# Cython declarations for virtual_machine.py (pure Python mode); see setup.py
+
+cimport cython
+
+from task cimport Task
+
+
+@cython.final
+cdef class VirtualMachine:
+    cdef public object vm_id
+    cdef public long available_time, total_busy_time, task_count
+
+    cpdef (long, long) assign_task(self, Task task)
@@ -2,6 +2,14 @@
 VirtualMachine Class - Represents a VM resource in the cloud system
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    from task import Task
+
+
 class VirtualMachine:
     """
     Represents a Virtual Machine that executes tasks.
@@ -9,11 +17,18 @@ class VirtualMachine:
     Attributes:
         vm_id (str): Unique identifier for the VM
         available_time (int): Time when VM becomes available for next task
-        task_history (list): List of tasks executed on this VM
+        task_count (int): Number of tasks executed on this VM
         total_busy_time (int): Total time VM was executing tasks
     """
     
-    def __init__(self, vm_id):
+    __slots__ = ('vm_id', 'available_time', 'task_count', 'total_busy_time')
+    
+    vm_id: str
+    available_time: int
+    task_count: int
+    total_busy_time: int
+    
+    def __init__(self, vm_id: str) -> None:
         """
         Initialize a new Virtual Machine.
         
@@ -22,10 +37,10 @@ class VirtualMachine:
         """
         self.vm_id = vm_id
         self.available_time = 0
-        self.task_history = []
+        self.task_count = 0
         self.total_busy_time = 0
         
-    def assign_task(self, task):
+    def assign_task(self, task: Task) -> Tuple[int, int]:
         """
         Assign a task to this VM and update scheduling information.
         
@@ -43,15 +58,17 @@ class VirtualMachine:
         task.start_time = start_time
         task.completion_time = completion_time
         task.vm_id = self.vm_id
+        task.waiting_time = start_time - task.arrival_time
+        task.turnaround_time = completion_time - task.arrival_time
         
         # Update VM state
         self.available_time = completion_time
         self.total_busy_time += task.burst_time
-        self.task_history.append(task)
+        self.task_count += 1
         
         return start_time, completion_time
     
-    def get_utilization(self, makespan):
+    def get_utilization(self, makespan: int) -> float:
         """
         Calculate utilization percentage of this VM.
         
@@ -65,6 +82,6 @@ class VirtualMachine:
             return 0.0
         return (self.total_busy_time / makespan) * 100
     
-    def __repr__(self):
+    def __repr__(self) -> str:
         """String representation of the VM."""
-        return f"VM({self.vm_id}, Available={self.available_time}, Tasks={len(self.task_history)})"
+        return f"VM({self.vm_id}, Available={self.available_time}, Tasks={self.task_count})"
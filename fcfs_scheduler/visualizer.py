@@ -2,10 +2,12 @@
 Visualizer - Creates Gantt charts and utilization graphs
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import pandas as pd
-import numpy as np
+# numpy and matplotlib are imported when the table or a chart is first
+# generated, so importing this module (e.g. from main.py) stays cheap
+
+
+# Gantt charts with more tasks than this are drawn without per-task labels
+MAX_LABELED_TASKS = 50
 
 
 class Visualizer:
@@ -22,32 +24,119 @@ class Visualizer:
         """
         self.scheduler = scheduler
         
-    def generate_gantt_chart(self, filename='gantt_chart.png'):
+        # One figure is reused (cleared) for every chart; created on first use
+        self._fig = None
+        self._ax = None
+        
+    def _build_snapshot(self):
+        """
+        Collect the current scheduling results into NumPy arrays in a single
+        pass. Built per call (not cached) so a rerun scheduler is never shown
+        with stale results.
+        
+        Returns:
+            dict: Per-task int64 arrays ('arrival', 'burst', 'start',
+                'completion', 'waiting', 'turnaround', and 'vm_idx', the
+                position of the assigned VM in scheduler.vms), the
+                'task_id' list, and the per-VM 'busy' time array
+                
+        Raises:
+            ValueError: If any task has not been scheduled yet
+        """
+        import numpy as np
+        
+        tasks = self.scheduler.tasks
+        vms = self.scheduler.vms
+        unscheduled = [task.task_id for task in tasks if task.vm_id is None]
+        if unscheduled:
+            raise ValueError(f"{len(unscheduled)} task(s) not scheduled yet "
+                             f"(first: {unscheduled[0]}); "
+                             "run simulate_execution() before visualizing")
+        vm_positions = {vm.vm_id: i for i, vm in enumerate(vms)}
+        
+        def column(values):
+            return np.fromiter(values, dtype=np.int64, count=len(tasks))
+        
+        return {
+            'task_id': [task.task_id for task in tasks],
+            'arrival': column(task.arrival_time for task in tasks),
+            'burst': column(task.burst_time for task in tasks),
+            'start': column(task.start_time for task in tasks),
+            'completion': column(task.completion_time for task in tasks),
+            'waiting': column(task.waiting_time for task in tasks),
+            'turnaround': column(task.turnaround_time for task in tasks),
+            'vm_idx': column(vm_positions[task.vm_id] for task in tasks),
+            'busy': np.fromiter((vm.total_busy_time for vm in vms),
+                                dtype=np.int64, count=len(vms)),
+        }
+        
+    def _prepare_axes(self, width, height):
+        """
+        Get the shared chart axes, cleared and resized for a new chart.
+        
+        Args:
+            width (float): Figure width in inches
+            height (float): Figure height in inches
+            
+        Returns:
+            matplotlib.axes.Axes: The cleared axes
+        """
+        if self._fig is None:
+            # A bare Figure is never registered with pyplot (nothing to close)
+            # and renders through Agg when saved, without touching the
+            # process-wide backend
+            from matplotlib.figure import Figure
+            
+            self._fig = Figure(figsize=(width, height))
+            self._ax = self._fig.add_subplot()
+            # Lay out at draw time, so savefig needs no bbox_inches='tight'
+            # measuring pass
+            self._fig.set_layout_engine('tight')
+        else:
+            self._fig.set_size_inches(width, height)
+            self._ax.clear()
+        return self._ax
+        
+    def generate_gantt_chart(self, filename='gantt_chart.png', snapshot=None):
         """
         Generate a Gantt chart showing task execution timeline across VMs.
         
         Args:
             filename (str): Output filename for the chart
+            snapshot (dict): Results from _build_snapshot(); built if omitted
         """
-        fig, ax = plt.subplots(figsize=(14, 6))
+        from matplotlib import colormaps
+        import numpy as np
         
-        # Color palette for different tasks
-        colors = plt.cm.Set3(np.linspace(0, 1, len(self.scheduler.tasks)))
-        task_colors = {task.task_id: colors[i] for i, task in enumerate(self.scheduler.tasks)}
+        ax = self._prepare_axes(14, 6)
         
-        # Plot each task as a horizontal bar on its assigned VM
-        vm_positions = {vm.vm_id: i for i, vm in enumerate(self.scheduler.vms)}
+        if snapshot is None:
+            snapshot = self._build_snapshot()
+        start = snapshot['start']
+        burst = snapshot['burst']
+        vm_idx = snapshot['vm_idx']
         
-        for task in self.scheduler.tasks:
-            vm_pos = vm_positions[task.vm_id]
-            ax.barh(vm_pos, task.burst_time, left=task.start_time, 
-                   height=0.6, color=task_colors[task.task_id],
-                   edgecolor='black', linewidth=1.5)
-            
-            # Add task label in the middle of the bar
-            ax.text(task.start_time + task.burst_time / 2, vm_pos,
-                   task.task_id, ha='center', va='center',
-                   fontsize=10, fontweight='bold')
+        # Color palette for different tasks; rows are in task order
+        rgba = colormaps['Set3'](np.linspace(0, 1, len(snapshot['task_id'])))
+        
+        # Group task indices by VM row so each row is drawn in one call
+        order = np.argsort(vm_idx, kind='stable')
+        vm_rows, first = np.unique(vm_idx[order], return_index=True)
+        
+        # Plot each VM's tasks as one collection of horizontal bars, with
+        # colors as plain RGBA tuples so matplotlib's color parsing is fast
+        for vm_pos, group in zip(vm_rows.tolist(), np.split(order, first[1:])):
+            ax.broken_barh(np.column_stack((start[group], burst[group])).tolist(),
+                           (vm_pos - 0.3, 0.6),
+                           facecolors=[tuple(color) for color in rgba[group].tolist()],
+                           edgecolor='black', linewidth=1.5)
+        
+        # Add task labels in the middle of the bars (skipped for crowded charts)
+        if len(snapshot['task_id']) <= MAX_LABELED_TASKS:
+            centers = (start + burst / 2).tolist()
+            for x, y, task_id in zip(centers, vm_idx.tolist(), snapshot['task_id']):
+                ax.text(x, y, task_id, ha='center', va='center',
+                       fontsize=10, fontweight='bold')
         
         # Configure axes
         ax.set_yticks(range(len(self.scheduler.vms)))
@@ -66,23 +155,31 @@ class Visualizer:
                   linewidth=2, label=f'Makespan: {self.scheduler.makespan}')
         ax.legend(loc='upper right')
         
-        plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        self._fig.savefig(filename, dpi=150)
         print(f"\n✓ Gantt chart saved as '{filename}'")
-        plt.close()
         
-    def generate_utilization_chart(self, filename='vm_utilization.png'):
+    def generate_utilization_chart(self, filename='vm_utilization.png', snapshot=None):
         """
         Generate a bar chart showing VM utilization percentages.
         
         Args:
             filename (str): Output filename for the chart
+            snapshot (dict): Results from _build_snapshot(); built if omitted
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        import numpy as np
         
+        ax = self._prepare_axes(10, 6)
+        
+        makespan = self.scheduler.makespan
+        if snapshot is None:
+            snapshot = self._build_snapshot()
+        busy = snapshot['busy']
         vm_ids = [vm.vm_id for vm in self.scheduler.vms]
-        utilizations = [vm.get_utilization(self.scheduler.makespan) 
-                       for vm in self.scheduler.vms]
+        if makespan:
+            utilization_array = busy / makespan * 100
+        else:
+            utilization_array = np.zeros(len(busy))
+        utilizations = utilization_array.tolist()
         
         # Create bars with gradient colors based on utilization
         colors = ['#2ecc71' if u >= 70 else '#f39c12' if u >= 40 else '#e74c3c' 
@@ -92,16 +189,15 @@ class Visualizer:
                      linewidth=2, alpha=0.8)
         
         # Add percentage labels on top of bars
-        for i, (bar, util) in enumerate(zip(bars, utilizations)):
+        for bar, util, busy_time in zip(bars, utilizations, busy.tolist()):
             height = bar.get_height()
             ax.text(bar.get_x() + bar.get_width()/2., height + 1,
                    f'{util:.2f}%', ha='center', va='bottom',
                    fontsize=12, fontweight='bold')
             
             # Add busy time info below
-            busy_time = self.scheduler.vms[i].total_busy_time
             ax.text(bar.get_x() + bar.get_width()/2., -5,
-                   f'{busy_time}/{self.scheduler.makespan} units',
+                   f'{busy_time}/{makespan} units',
                    ha='center', va='top', fontsize=10)
         
         # Configure axes
@@ -113,33 +209,56 @@ class Visualizer:
         ax.grid(True, axis='y', alpha=0.3, linestyle='--')
         
         # Add average line
-        avg_util = sum(utilizations) / len(utilizations)
+        avg_util = float(utilization_array.mean())
         ax.axhline(y=avg_util, color='blue', linestyle='--', linewidth=2,
                   label=f'Average: {avg_util:.2f}%')
         ax.legend(loc='upper right')
         
-        plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        self._fig.savefig(filename, dpi=150)
         print(f"✓ VM utilization chart saved as '{filename}'")
-        plt.close()
         
-    def print_execution_table(self):
+    def print_execution_table(self, snapshot=None):
         """
         Print a formatted table showing task execution details.
+        
+        Args:
+            snapshot (dict): Results from _build_snapshot(); built if omitted
         """
-        data = self.scheduler.get_scheduling_data()
-        df = pd.DataFrame(data)
+        if snapshot is None:
+            snapshot = self._build_snapshot()
+        vm_ids = [vm.vm_id for vm in self.scheduler.vms]
+        
+        # Same columns as FCFSScheduler.get_scheduling_data(), as string lists
+        table = {
+            'Task ID': [str(task_id) for task_id in snapshot['task_id']],
+            'Arrival Time': snapshot['arrival'].astype(str).tolist(),
+            'Burst Time': snapshot['burst'].astype(str).tolist(),
+            'Start Time': snapshot['start'].astype(str).tolist(),
+            'Completion Time': snapshot['completion'].astype(str).tolist(),
+            'VM': [vm_ids[i] for i in snapshot['vm_idx'].tolist()],
+            'Waiting Time': snapshot['waiting'].astype(str).tolist(),
+            'Turnaround Time': snapshot['turnaround'].astype(str).tolist(),
+        }
+        columns = list(table)
+        
+        # Right-align each column to its widest entry (header or value)
+        widths = [max(len(column), *map(len, table[column])) for column in columns]
+        row_format = "  ".join(f"{{:>{width}}}" for width in widths)
         
         print("\n" + "=" * 70)
         print("TASK EXECUTION DETAILS")
         print("=" * 70)
-        print(df.to_string(index=False))
+        print(row_format.format(*columns))
+        for row in zip(*table.values()):
+            print(row_format.format(*row))
         print("=" * 70)
         
     def generate_all_visualizations(self):
         """
         Generate all visualizations and display execution table.
         """
-        self.print_execution_table()
-        self.generate_gantt_chart()
-        self.generate_utilization_chart()
+        # Read the scheduling results once and share them across all three
+        snapshot = self._build_snapshot()
+        self.print_execution_table(snapshot=snapshot)
+        self.generate_gantt_chart(snapshot=snapshot)
+        self.generate_utilization_chart(snapshot=snapshot)